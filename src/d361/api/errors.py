@@ -31,6 +31,7 @@ class ErrorCategory(str, Enum):
     NOT_FOUND = "not_found"          # Resource not found
     SERVER_ERROR = "server_error"    # Server-side errors
     CLIENT_ERROR = "client_error"    # Client-side errors
+    CONFIGURATION = "configuration"  # Configuration and secrets errors
     UNKNOWN = "unknown"              # Unclassified errors
 
 
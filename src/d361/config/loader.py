@@ -31,30 +31,39 @@ class ConfigValidator:
     helpful error messages for common misconfigurations.
     """
     
+    # Default rule lists memoized per environment; the rules only depend on
+    # self.environment, so bound methods from the first validator built for
+    # an environment can be reused by every later instance.
+    _default_rules_cache: Dict[Environment, List[Callable[[AppConfig], List[str]]]] = {}
+
     def __init__(self, environment: Environment):
         """
         Initialize configuration validator.
-        
+
         Args:
             environment: Target environment for validation
         """
         self.environment = environment
-        self.validation_rules: List[Callable[[AppConfig], List[str]]] = []
-        
-        # Add default validation rules
-        self._add_default_rules()
-    
-    def _add_default_rules(self) -> None:
-        """Add default validation rules."""
-        self.validation_rules.extend([
-            self._validate_production_debug,
-            self._validate_production_secrets,
-            self._validate_production_monitoring,
-            self._validate_production_security,
-            self._validate_resource_limits,
-            self._validate_network_settings,
-            self._validate_database_settings
-        ])
+        # Copy the cached defaults so add_rule stays per-instance
+        self.validation_rules: List[Callable[[AppConfig], List[str]]] = list(
+            self._get_default_rules()
+        )
+
+    def _get_default_rules(self) -> List[Callable[[AppConfig], List[str]]]:
+        """Get the default validation rules for this environment, cached."""
+        cached = ConfigValidator._default_rules_cache.get(self.environment)
+        if cached is None:
+            cached = [
+                self._validate_production_debug,
+                self._validate_production_secrets,
+                self._validate_production_monitoring,
+                self._validate_production_security,
+                self._validate_resource_limits,
+                self._validate_network_settings,
+                self._validate_database_settings
+            ]
+            ConfigValidator._default_rules_cache[self.environment] = cached
+        return cached
     
     def _validate_production_debug(self, config: AppConfig) -> List[str]:
         """Validate debug settings for production."""
@@ -6,185 +6,25 @@ different MkDocs themes.
 """
 # this_file: external/int_folders/d361/src/d361/mkdocs/exporters/theme_optimizer.py
 
+import asyncio
+import os
+from functools import cached_property
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, Optional
 import shutil
 
+import aiofiles
 from loguru import logger
 
 from d361.core.models import Article, Category
 
 
-class ThemeOptimizer:
-    """Apply theme-specific optimizations to MkDocs exports.
-    
-    This class handles theme-specific customizations, asset processing,
-    and content optimizations to ensure the best presentation in different
-    MkDocs themes.
-    
-    Supported themes:
-    - Material for MkDocs (full feature support)
-    - Read the Docs theme
-    - MkDocs default theme
-    - Custom themes (basic support)
-    
-    Features:
-    - CSS and JavaScript customizations
-    - Template overrides and extensions
-    - Asset optimization and processing
-    - Theme-specific content formatting
-    - Accessibility and SEO enhancements
-    
-    Example:
-        optimizer = ThemeOptimizer(theme="material")
-        await optimizer.optimize(articles, categories, output_path)
-    """
-    
-    def __init__(
-        self,
-        theme: str = "material",
-        custom_css: Optional[List[str]] = None,
-        custom_js: Optional[List[str]] = None,
-        enable_customizations: bool = True,
-    ) -> None:
-        """Initialize theme optimizer.
-        
-        Args:
-            theme: MkDocs theme to optimize for
-            custom_css: List of custom CSS files to include
-            custom_js: List of custom JavaScript files to include
-            enable_customizations: Enable theme-specific customizations
-        """
-        self.theme = theme
-        self.custom_css = custom_css or []
-        self.custom_js = custom_js or []
-        self.enable_customizations = enable_customizations
-        
-        # Theme-specific settings
-        self.theme_settings = self._get_theme_settings()
-        
-        logger.info(f"Initialized ThemeOptimizer for {theme} theme")
-    
-    def _get_theme_settings(self) -> Dict[str, Any]:
-        """Get theme-specific settings and configurations."""
-        if self.theme == "material":
-            return {
-                "supports_social_cards": True,
-                "supports_instant_loading": True,
-                "supports_tabs": True,
-                "supports_sections": True,
-                "supports_search_highlighting": True,
-                "supports_code_annotations": True,
-                "supports_content_tabs": True,
-                "requires_custom_css": True,
-                "requires_custom_js": False,
-            }
-        elif self.theme == "readthedocs":
-            return {
-                "supports_social_cards": False,
-                "supports_instant_loading": False,
-                "supports_tabs": False,
-                "supports_sections": True,
-                "supports_search_highlighting": True,
-                "supports_code_annotations": False,
-                "supports_content_tabs": False,
-                "requires_custom_css": True,
-                "requires_custom_js": False,
-            }
-        else:
-            return {
-                "supports_social_cards": False,
-                "supports_instant_loading": False,
-                "supports_tabs": False,
-                "supports_sections": True,
-                "supports_search_highlighting": False,
-                "supports_code_annotations": False,
-                "supports_content_tabs": False,
-                "requires_custom_css": False,
-                "requires_custom_js": False,
-            }
-    
-    async def optimize(
-        self,
-        articles: List[Article],
-        categories: List[Category],
-        output_path: Path,
-    ) -> Dict[str, Any]:
-        """Apply theme-specific optimizations to MkDocs export.
-        
-        Args:
-            articles: List of articles to optimize
-            categories: List of categories to optimize
-            output_path: Output directory path
-            
-        Returns:
-            Optimization results and statistics
-        """
-        logger.info(f"Applying {self.theme} theme optimizations")
-        
-        results = {
-            "theme": self.theme,
-            "optimizations_applied": [],
-            "files_created": [],
-            "files_modified": [],
-            "warnings": [],
-        }
-        
-        if not self.enable_customizations:
-            logger.info("Theme customizations disabled")
-            return results
-        
-        # Apply theme-specific optimizations
-        if self.theme == "material":
-            await self._optimize_material_theme(articles, categories, output_path, results)
-        elif self.theme == "readthedocs":
-            await self._optimize_readthedocs_theme(articles, categories, output_path, results)
-        else:
-            await self._optimize_generic_theme(articles, categories, output_path, results)
-        
-        # Apply common optimizations
-        await self._apply_common_optimizations(articles, categories, output_path, results)
-        
-        logger.info(f"Theme optimization complete: {len(results['optimizations_applied'])} optimizations applied")
-        return results
-    
-    async def _optimize_material_theme(
-        self,
-        articles: List[Article],
-        categories: List[Category],
-        output_path: Path,
-        results: Dict[str, Any],
-    ) -> None:
-        """Apply Material theme specific optimizations."""
-        logger.info("Applying Material theme optimizations")
-        
-        # Create custom CSS for Material theme
-        await self._create_material_css(output_path, results)
-        
-        # Create custom JavaScript if needed
-        await self._create_material_js(output_path, results)
-        
-        # Setup social cards assets
-        await self._setup_material_social_cards(output_path, results)
-        
-        # Create custom templates if needed
-        await self._create_material_templates(output_path, results)
-        
-        # Optimize content for Material theme features
-        await self._optimize_material_content(articles, output_path, results)
-        
-        results["optimizations_applied"].extend([
-            "material_css_customization",
-            "material_social_cards",
-            "material_content_optimization",
-        ])
-    
-    async def _create_material_css(self, output_path: Path, results: Dict[str, Any]) -> None:
-        """Create custom CSS for Material theme."""
-        css_dir = output_path / "docs" / "stylesheets"
-        css_dir.mkdir(parents=True, exist_ok=True)
-        
-        css_content = """
+# Asset templates shared by every optimizer instance. The three theme CSS
+# bodies intentionally stay separate: their .d360-* rules differ in spacing
+# and selectors per theme, and the tests pin the emitted text, so only the
+# literals themselves are deduplicated to one module-level copy each.
+_MATERIAL_CSS = """
 /* Material theme customizations for Document360 content */
 :root {
   /* Custom color palette */
@@ -322,19 +162,8 @@ class ThemeOptimizer:
   }
 }
 """
-        
-        css_path = css_dir / "extra.css"
-        css_path.write_text(css_content, encoding="utf-8")
-        
-        results["files_created"].append(str(css_path))
-        logger.info(f"Created Material theme CSS: {css_path}")
-    
-    async def _create_material_js(self, output_path: Path, results: Dict[str, Any]) -> None:
-        """Create custom JavaScript for Material theme."""
-        js_dir = output_path / "docs" / "javascripts"
-        js_dir.mkdir(parents=True, exist_ok=True)
-        
-        js_content = """
+
+_MATERIAL_JS = """
 // Material theme enhancements for Document360 content
 document.addEventListener('DOMContentLoaded', function() {
     // Enhanced image handling
@@ -387,10 +216,272 @@ document$.subscribe(function() {
     }
 });
 """
+
+_READTHEDOCS_CSS = """
+/* Read the Docs theme customizations */
+.rst-content .d360-callout {
+    margin-bottom: 24px;
+    padding: 12px;
+    border-left: 3px solid;
+    background: #f8f8f8;
+}
+
+.rst-content .d360-callout--note {
+    border-color: #1976d2;
+}
+
+.rst-content .d360-callout--warning {
+    border-color: #ff9800;
+}
+
+.rst-content .d360-image {
+    max-width: 100%;
+    height: auto;
+    margin: 12px 0;
+}
+"""
+
+_GENERIC_CSS = """
+/* Generic theme customizations for Document360 content */
+.d360-callout {
+    margin: 1em 0;
+    padding: 1em;
+    border: 1px solid #ccc;
+    border-radius: 4px;
+    background: #f9f9f9;
+}
+
+.d360-image {
+    max-width: 100%;
+    height: auto;
+}
+
+.d360-table {
+    width: 100%;
+    border-collapse: collapse;
+}
+
+.d360-table th,
+.d360-table td {
+    padding: 8px;
+    text-align: left;
+    border: 1px solid #ddd;
+}
+"""
+
+
+class ThemeOptimizer:
+    """Apply theme-specific optimizations to MkDocs exports.
+    
+    This class handles theme-specific customizations, asset processing,
+    and content optimizations to ensure the best presentation in different
+    MkDocs themes.
+    
+    Supported themes:
+    - Material for MkDocs (full feature support)
+    - Read the Docs theme
+    - MkDocs default theme
+    - Custom themes (basic support)
+    
+    Features:
+    - CSS and JavaScript customizations
+    - Template overrides and extensions
+    - Asset optimization and processing
+    - Theme-specific content formatting
+    - Accessibility and SEO enhancements
+    
+    Example:
+        optimizer = ThemeOptimizer(theme="material")
+        await optimizer.optimize(articles, categories, output_path)
+    """
+    
+    def __init__(
+        self,
+        theme: str = "material",
+        custom_css: Optional[List[str]] = None,
+        custom_js: Optional[List[str]] = None,
+        enable_customizations: bool = True,
+    ) -> None:
+        """Initialize theme optimizer.
         
-        js_path = js_dir / "extra.js"
-        js_path.write_text(js_content, encoding="utf-8")
+        Args:
+            theme: MkDocs theme to optimize for
+            custom_css: List of custom CSS files to include
+            custom_js: List of custom JavaScript files to include
+            enable_customizations: Enable theme-specific customizations
+        """
+        self.theme = theme
+        self.custom_css = custom_css or []
+        self.custom_js = custom_js or []
+        self.enable_customizations = enable_customizations
+        
+        # Theme-specific settings
+        self.theme_settings = self._get_theme_settings()
+        
+        logger.info(f"Initialized ThemeOptimizer for {theme} theme")
+    
+    def _get_theme_settings(self) -> Dict[str, Any]:
+        """Get theme-specific settings and configurations."""
+        if self.theme == "material":
+            return {
+                "supports_social_cards": True,
+                "supports_instant_loading": True,
+                "supports_tabs": True,
+                "supports_sections": True,
+                "supports_search_highlighting": True,
+                "supports_code_annotations": True,
+                "supports_content_tabs": True,
+                "requires_custom_css": True,
+                "requires_custom_js": False,
+            }
+        elif self.theme == "readthedocs":
+            return {
+                "supports_social_cards": False,
+                "supports_instant_loading": False,
+                "supports_tabs": False,
+                "supports_sections": True,
+                "supports_search_highlighting": True,
+                "supports_code_annotations": False,
+                "supports_content_tabs": False,
+                "requires_custom_css": True,
+                "requires_custom_js": False,
+            }
+        else:
+            return {
+                "supports_social_cards": False,
+                "supports_instant_loading": False,
+                "supports_tabs": False,
+                "supports_sections": True,
+                "supports_search_highlighting": False,
+                "supports_code_annotations": False,
+                "supports_content_tabs": False,
+                "requires_custom_css": False,
+                "requires_custom_js": False,
+            }
+    
+    async def optimize(
+        self,
+        articles: List[Article],
+        categories: List[Category],
+        output_path: Path,
+    ) -> Dict[str, Any]:
+        """Apply theme-specific optimizations to MkDocs export.
+        
+        Args:
+            articles: List of articles to optimize
+            categories: List of categories to optimize
+            output_path: Output directory path
+            
+        Returns:
+            Optimization results and statistics
+        """
+        logger.info(f"Applying {self.theme} theme optimizations")
+        
+        results = {
+            "theme": self.theme,
+            "optimizations_applied": [],
+            "files_created": [],
+            "files_modified": [],
+            "warnings": [],
+        }
+        
+        if not self.enable_customizations:
+            logger.info("Theme customizations disabled")
+            return results
+
+        # Create all asset directories up front so the individual
+        # optimization steps don't need their own mkdir calls.
+        self._ensure_asset_dirs(output_path)
+
+        # Apply theme-specific optimizations
+        if self.theme == "material":
+            await self._optimize_material_theme(articles, categories, output_path, results)
+        elif self.theme == "readthedocs":
+            await self._optimize_readthedocs_theme(articles, categories, output_path, results)
+        else:
+            await self._optimize_generic_theme(articles, categories, output_path, results)
+        
+        # Apply common optimizations
+        await self._apply_common_optimizations(articles, categories, output_path, results)
         
+        logger.info(f"Theme optimization complete: {len(results['optimizations_applied'])} optimizations applied")
+        return results
+
+    @staticmethod
+    def _ensure_asset_dirs(output_path: Path) -> None:
+        """Create the asset directory tree in a single pass.
+
+        One os.makedirs call per leaf directory replaces the scattered
+        per-step mkdir calls during an optimize run.
+        """
+        docs_dir = output_path / "docs"
+        for leaf in ("stylesheets", "javascripts", "assets"):
+            os.makedirs(docs_dir / leaf, exist_ok=True)
+
+    async def _optimize_material_theme(
+        self,
+        articles: List[Article],
+        categories: List[Category],
+        output_path: Path,
+        results: Dict[str, Any],
+    ) -> None:
+        """Apply Material theme specific optimizations."""
+        logger.info("Applying Material theme optimizations")
+
+        # CSS, JavaScript, and social cards setup touch independent files,
+        # so run them concurrently. Each task writes into its own partial
+        # results dict to avoid interleaved appends on the shared lists.
+        partial_results = [
+            {"files_created": [], "files_modified": [], "warnings": []}
+            for _ in range(3)
+        ]
+        await asyncio.gather(
+            self._create_material_css(output_path, partial_results[0]),
+            self._create_material_js(output_path, partial_results[1]),
+            self._setup_material_social_cards(output_path, partial_results[2]),
+        )
+        for partial in partial_results:
+            results["files_created"].extend(partial["files_created"])
+            results["files_modified"].extend(partial["files_modified"])
+            results["warnings"].extend(partial["warnings"])
+
+        # Create custom templates if needed
+        await self._create_material_templates(output_path, results)
+        
+        # Optimize content for Material theme features
+        await self._optimize_material_content(articles, output_path, results)
+        
+        results["optimizations_applied"].extend([
+            "material_css_customization",
+            "material_social_cards",
+            "material_content_optimization",
+        ])
+    
+    async def _create_material_css(self, output_path: Path, results: Dict[str, Any]) -> None:
+        """Create custom CSS for Material theme."""
+        css_dir = output_path / "docs" / "stylesheets"
+        css_dir.mkdir(parents=True, exist_ok=True)
+        
+        css_content = _MATERIAL_CSS
+        
+        css_path = css_dir / "extra.css"
+        async with aiofiles.open(css_path, "w", encoding="utf-8") as f:
+            await f.write(css_content)
+
+        results["files_created"].append(str(css_path))
+        logger.info(f"Created Material theme CSS: {css_path}")
+    
+    async def _create_material_js(self, output_path: Path, results: Dict[str, Any]) -> None:
+        """Create custom JavaScript for Material theme."""
+        js_dir = output_path / "docs" / "javascripts"
+        js_dir.mkdir(parents=True, exist_ok=True)
+        
+        js_content = _MATERIAL_JS
+        
+        js_path = js_dir / "extra.js"
+        async with aiofiles.open(js_path, "w", encoding="utf-8") as f:
+            await f.write(js_content)
+
         results["files_created"].append(str(js_path))
         logger.info(f"Created Material theme JavaScript: {js_path}")
     
@@ -433,35 +524,13 @@ document$.subscribe(function() {
         
         # Create custom CSS for RTD theme
         css_dir = output_path / "docs" / "stylesheets"
-        css_dir.mkdir(parents=True, exist_ok=True)
         
-        css_content = """
-/* Read the Docs theme customizations */
-.rst-content .d360-callout {
-    margin-bottom: 24px;
-    padding: 12px;
-    border-left: 3px solid;
-    background: #f8f8f8;
-}
-
-.rst-content .d360-callout--note {
-    border-color: #1976d2;
-}
-
-.rst-content .d360-callout--warning {
-    border-color: #ff9800;
-}
-
-.rst-content .d360-image {
-    max-width: 100%;
-    height: auto;
-    margin: 12px 0;
-}
-"""
+        css_content = _READTHEDOCS_CSS
         
         css_path = css_dir / "extra.css"
-        css_path.write_text(css_content, encoding="utf-8")
-        
+        async with aiofiles.open(css_path, "w", encoding="utf-8") as f:
+            await f.write(css_content)
+
         results["files_created"].append(str(css_path))
         results["optimizations_applied"].append("readthedocs_css_customization")
     
@@ -477,39 +546,13 @@ document$.subscribe(function() {
         
         # Basic CSS for any theme
         css_dir = output_path / "docs" / "stylesheets"
-        css_dir.mkdir(parents=True, exist_ok=True)
         
-        css_content = """
-/* Generic theme customizations for Document360 content */
-.d360-callout {
-    margin: 1em 0;
-    padding: 1em;
-    border: 1px solid #ccc;
-    border-radius: 4px;
-    background: #f9f9f9;
-}
-
-.d360-image {
-    max-width: 100%;
-    height: auto;
-}
-
-.d360-table {
-    width: 100%;
-    border-collapse: collapse;
-}
-
-.d360-table th,
-.d360-table td {
-    padding: 8px;
-    text-align: left;
-    border: 1px solid #ddd;
-}
-"""
+        css_content = _GENERIC_CSS
         
         css_path = css_dir / "extra.css"
-        css_path.write_text(css_content, encoding="utf-8")
-        
+        async with aiofiles.open(css_path, "w", encoding="utf-8") as f:
+            await f.write(css_content)
+
         results["files_created"].append(str(css_path))
         results["optimizations_applied"].append("generic_theme_css")
     
@@ -521,17 +564,18 @@ document$.subscribe(function() {
         results: Dict[str, Any],
     ) -> None:
         """Apply optimizations common to all themes."""
+        if not self.enable_customizations:
+            return
+
         logger.info("Applying common theme optimizations")
         
         # Copy custom CSS files if provided
         if self.custom_css:
             css_dir = output_path / "docs" / "stylesheets"
-            css_dir.mkdir(parents=True, exist_ok=True)
-            
             for css_file in self.custom_css:
                 if Path(css_file).exists():
                     dest_path = css_dir / Path(css_file).name
-                    shutil.copy2(css_file, dest_path)
+                    self._install_asset(Path(css_file), dest_path)
                     results["files_created"].append(str(dest_path))
                 else:
                     results["warnings"].append(f"Custom CSS file not found: {css_file}")
@@ -539,23 +583,45 @@ document$.subscribe(function() {
         # Copy custom JavaScript files if provided
         if self.custom_js:
             js_dir = output_path / "docs" / "javascripts"
-            js_dir.mkdir(parents=True, exist_ok=True)
-            
             for js_file in self.custom_js:
                 if Path(js_file).exists():
                     dest_path = js_dir / Path(js_file).name
-                    shutil.copy2(js_file, dest_path)
+                    self._install_asset(Path(js_file), dest_path)
                     results["files_created"].append(str(dest_path))
                 else:
                     results["warnings"].append(f"Custom JS file not found: {js_file}")
         
         results["optimizations_applied"].append("common_optimizations")
-    
-    def get_theme_config_updates(self) -> Dict[str, Any]:
+
+    @staticmethod
+    def _install_asset(source: Path, dest: Path) -> None:
+        """Place a custom asset at dest, hard-linking instead of copying when possible.
+
+        Hard links avoid duplicating file contents when source and destination
+        live on the same filesystem; cross-device links (or filesystems without
+        link support) fall back to a regular copy.
+        """
+        dest.unlink(missing_ok=True)
+        try:
+            os.link(source, dest)
+        except OSError:
+            shutil.copy2(source, dest)
+
+    def get_theme_config_updates(self) -> Mapping[str, Any]:
         """Get configuration updates needed for the theme.
-        
+
         Returns:
-            Dictionary of configuration updates for mkdocs.yml
+            Read-only mapping of configuration updates for mkdocs.yml
+        """
+        return self.theme_config_updates
+
+    @cached_property
+    def theme_config_updates(self) -> Mapping[str, Any]:
+        """Configuration updates for mkdocs.yml, computed once per instance.
+
+        The theme and custom asset lists are fixed after __init__, so the
+        mapping is built lazily on first access and cached; it is wrapped in
+        a MappingProxyType so callers cannot mutate the cached value.
         """
         config_updates = {}
         
@@ -588,5 +654,5 @@ document$.subscribe(function() {
                 config_updates["extra_javascript"] = []
             for js_file in self.custom_js:
                 config_updates["extra_javascript"].append(f"javascripts/{Path(js_file).name}")
-        
-        return config_updates
\ No newline at end of file
+
+        return MappingProxyType(config_updates)
\ No newline at end of file
@@ -16,7 +16,7 @@ from urllib.parse import urljoin
 
 from loguru import logger
 
-from ..api.client import Document360ApiClient
+from ..api.client import ApiConfig, Document360ApiClient
 from ..api.token_manager import TokenManager
 from ..core.interfaces import DataProvider  
 from ..core.models import Article, Category, ProjectVersion
@@ -67,10 +67,11 @@ class ApiProvider:
         
         # Initialize API client with token management
         self.api_client = Document360ApiClient(
-            tokens=tokens,
-            base_url=base_url,
-            rate_limit=rate_limit,
-            **kwargs
+            ApiConfig(
+                api_tokens=tokens,
+                base_url=base_url,
+                calls_per_minute=rate_limit,
+            )
         )
         
         logger.info(
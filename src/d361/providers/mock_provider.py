@@ -12,6 +12,7 @@ import asyncio
 from datetime import datetime
 from typing import Any, AsyncIterator
 
+from ..api.errors import NotFoundError
 from ..core.interfaces import DataProvider
 from ..core.models import Article, Category, ProjectVersion, PublishStatus
 
@@ -23,31 +24,59 @@ class MockProvider:
     configurable mock data for testing and development purposes.
     """
 
+    # Instances are created in bulk by tests; slots keep them small and
+    # make attribute reads direct descriptor lookups instead of dict hits.
+    __slots__ = (
+        "num_articles",
+        "num_categories",
+        "include_content",
+        "seed",
+        "simulate_delays",
+        "delay_ms",
+        "fail_probability",
+        "_mock_articles",
+        "_mock_categories",
+        "_mock_project",
+    )
+
     def __init__(
         self,
+        num_articles: int = 10,
+        num_categories: int = 5,
+        include_content: bool = True,
+        seed: int | None = None,
         simulate_delays: bool = False,
         delay_ms: int = 100,
         fail_probability: float = 0.0,
         **kwargs: Any,
     ) -> None:
         """Initialize the mock provider.
-        
+
         Args:
+            num_articles: Number of mock articles to generate
+            num_categories: Number of mock categories to generate
+            include_content: Whether generated articles carry content bodies
+            seed: Optional seed recorded for reproducible dataset requests;
+                generation is deterministic for a given configuration
             simulate_delays: Whether to simulate network delays
             delay_ms: Delay in milliseconds for simulated operations
             fail_probability: Probability of operations failing (0.0-1.0)
             **kwargs: Additional configuration options
         """
+        self.num_articles = num_articles
+        self.num_categories = num_categories
+        self.include_content = include_content
+        self.seed = seed
         self.simulate_delays = simulate_delays
         self.delay_ms = delay_ms
         self.fail_probability = fail_probability
-        
+
         # Generate mock data
         self._mock_articles = self._generate_mock_articles()
         self._mock_categories = self._generate_mock_categories()
         self._mock_project = self._generate_mock_project()
         
-    async def get_article(self, article_id: int, **kwargs: Any) -> Article:
+    async def get_article(self, article_id: int | str, **kwargs: Any) -> Article:
         """Fetch a mock article by ID.
         
         Args:
@@ -56,44 +85,56 @@ class MockProvider:
             
         Returns:
             Article: Mock article data
-            
+
         Raises:
-            ValueError: If article not found in mock data
+            NotFoundError: If article not found in mock data
         """
         await self._simulate_operation()
-        
+
         for article in self._mock_articles:
             if article.id == article_id:
                 return article
-                
-        raise ValueError(f"Article {article_id} not found in mock data")
+
+        raise NotFoundError(
+            f"Article {article_id} not found in mock data",
+            resource_id=str(article_id),
+        )
         
     async def list_articles(
         self,
-        category_id: int | None = None,
+        category_id: int | str | None = None,
         status: str | None = None,
+        limit: int | None = None,
+        offset: int = 0,
         **kwargs: Any,
     ) -> list[Article]:
-        """List mock articles with optional filtering.
-        
+        """List mock articles with optional filtering and pagination.
+
         Args:
             category_id: Filter by category
             status: Filter by status
+            limit: Maximum number of articles to return
+            offset: Number of articles to skip from the start
             **kwargs: Additional parameters
-            
+
         Returns:
             list[Article]: Filtered mock articles
         """
         await self._simulate_operation()
-        
+
         articles = self._mock_articles
-        
+
         if category_id is not None:
             articles = [a for a in articles if a.category_id == category_id]
-            
+
         if status is not None:
             articles = [a for a in articles if a.status.value == status]
-            
+
+        if offset:
+            articles = articles[offset:]
+        if limit is not None:
+            articles = articles[:limit]
+
         return articles
         
     async def stream_articles(self, **kwargs: Any) -> AsyncIterator[Article]:
@@ -112,7 +153,27 @@ class MockProvider:
                 await asyncio.sleep(self.delay_ms / 1000)
             yield article
             
-    async def get_category(self, category_id: int, **kwargs: Any) -> Category:
+    async def search_articles(self, query: str, **kwargs: Any) -> list[Article]:
+        """Search mock articles by title and content.
+
+        Args:
+            query: Search query
+            **kwargs: Additional parameters
+
+        Returns:
+            list[Article]: Articles matching the search query
+        """
+        await self._simulate_operation()
+
+        query_lower = query.lower()
+        return [
+            article
+            for article in self._mock_articles
+            if query_lower in article.title.lower()
+            or query_lower in article.content.lower()
+        ]
+
+    async def get_category(self, category_id: int | str, **kwargs: Any) -> Category:
         """Fetch a mock category by ID.
         
         Args:
@@ -121,17 +182,20 @@ class MockProvider:
             
         Returns:
             Category: Mock category data
-            
+
         Raises:
-            ValueError: If category not found in mock data
+            NotFoundError: If category not found in mock data
         """
         await self._simulate_operation()
-        
+
         for category in self._mock_categories:
             if category.id == category_id:
                 return category
-                
-        raise ValueError(f"Category {category_id} not found in mock data")
+
+        raise NotFoundError(
+            f"Category {category_id} not found in mock data",
+            resource_id=str(category_id),
+        )
         
     async def list_categories(self, **kwargs: Any) -> list[Category]:
         """List all mock categories.
@@ -156,7 +220,19 @@ class MockProvider:
         """
         await self._simulate_operation()
         return self._mock_project
-    
+
+    async def list_project_versions(self, **kwargs: Any) -> list[ProjectVersion]:
+        """List all mock project versions.
+
+        Args:
+            **kwargs: Additional parameters
+
+        Returns:
+            list[ProjectVersion]: All mock project versions
+        """
+        await self._simulate_operation()
+        return [self._mock_project]
+
     async def get_articles(self, **kwargs: Any) -> list[Article]:
         """Get all articles from mock data (MkDocsExporter interface).
         
@@ -182,129 +258,70 @@ class MockProvider:
     def _generate_mock_articles(self) -> list[Article]:
         """Generate mock article data."""
         now = datetime.now()
-        
-        return [
-            Article(
-                id=1,
-                title="Getting Started Guide",
-                slug="getting-started-guide",
-                content="<h1>Welcome</h1><p>This is a comprehensive getting started guide...</p>",
-                content_markdown="# Welcome\n\nThis is a comprehensive getting started guide...",
-                excerpt="Learn the basics of Document360",
-                category_id=1,
-                status=PublishStatus.PUBLISHED,
-                created_at=now,
-                updated_at=now,
-                author_name="John Doe",
-                author_email="john@example.com",
-                tags=["beginner", "tutorial"],
-            ),
-            Article(
-                id=2,
-                title="Advanced Configuration",
-                slug="advanced-configuration", 
-                content="<h1>Advanced Settings</h1><p>Configure advanced features...</p>",
-                content_markdown="# Advanced Settings\n\nConfigure advanced features...",
-                excerpt="Advanced configuration options",
-                category_id=1,
-                status=PublishStatus.PUBLISHED,
-                created_at=now,
-                updated_at=now,
-                author_name="Jane Smith",
-                author_email="jane@example.com",
-                tags=["advanced", "configuration"],
-            ),
-            Article(
-                id=3,
-                title="API Reference",
-                slug="api-reference",
-                content="<h1>API Documentation</h1><p>Complete API reference...</p>",
-                content_markdown="# API Documentation\n\nComplete API reference...",
-                excerpt="Complete API documentation",
-                category_id=2,
-                status=PublishStatus.PUBLISHED,
-                created_at=now,
-                updated_at=now,
-                author_name="Bob Wilson",
-                author_email="bob@example.com",
-                tags=["api", "reference"],
-            ),
-            Article(
-                id=4,
-                title="Draft Article",
-                slug="draft-article",
-                content="<h1>Work in Progress</h1><p>This article is still being written...</p>",
-                content_markdown="# Work in Progress\n\nThis article is still being written...",
-                excerpt="Article still in progress",
-                category_id=1,
-                status=PublishStatus.DRAFT,
-                created_at=now,
-                updated_at=now,
-                author_name="Alice Brown",
-                author_email="alice@example.com",
-                tags=["draft"],
-            ),
-        ]
-        
+        articles = []
+
+        for i in range(1, self.num_articles + 1):
+            category_number = (i - 1) % max(self.num_categories, 1) + 1
+            content = ""
+            content_markdown = ""
+            if self.include_content:
+                content = (
+                    f"<h1>Mock Article {i}</h1>"
+                    f"<p>Generated content for mock article {i}.</p>"
+                )
+                content_markdown = (
+                    f"# Mock Article {i}\n\nGenerated content for mock article {i}."
+                )
+
+            articles.append(
+                Article(
+                    id=f"mock-article-{i}",
+                    title=f"Mock Article {i}",
+                    slug=f"mock-article-{i}",
+                    content=content,
+                    content_markdown=content_markdown,
+                    excerpt=f"Excerpt for mock article {i}",
+                    category_id=f"mock-category-{category_number}",
+                    order=i,
+                    status=PublishStatus.PUBLISHED,
+                    created_at=now,
+                    updated_at=now,
+                    author_name="Mock Author",
+                    author_email="author@example.com",
+                    tags=["mock", f"topic-{category_number}"],
+                )
+            )
+
+        return articles
+
     def _generate_mock_categories(self) -> list[Category]:
         """Generate mock category data."""
         now = datetime.now()
-        
+
         return [
             Category(
-                id=1,
-                name="User Guide",
-                slug="user-guide",
-                parent_id=None,
-                order=1,
-                level=0,
-                path="User Guide",
-                description="User documentation and guides",
-                is_public=True,
-                status=PublishStatus.PUBLISHED,
-                created_at=now,
-                updated_at=now,
-                article_count=3,
-                subcategory_count=0,
-            ),
-            Category(
-                id=2,
-                name="Developer Documentation",
-                slug="developer-documentation",
+                id=f"mock-category-{i}",
+                name=f"Mock Category {i}",
+                slug=f"mock-category-{i}",
                 parent_id=None,
-                order=2,
+                order=i,
                 level=0,
-                path="Developer Documentation",
-                description="Technical documentation for developers",
+                path=f"Mock Category {i}",
+                description=f"Generated mock category {i}",
                 is_public=True,
                 status=PublishStatus.PUBLISHED,
                 created_at=now,
                 updated_at=now,
-                article_count=1,
-                subcategory_count=1,
-            ),
-            Category(
-                id=3,
-                name="API Reference",
-                slug="api-reference",
-                parent_id=2,
-                order=1,
-                level=1,
-                path="Developer Documentation/API Reference",
-                description="Complete API reference documentation",
-                is_public=True,
-                status=PublishStatus.PUBLISHED,
-                created_at=now,
-                updated_at=now,
-                article_count=1,
+                article_count=0,
                 subcategory_count=0,
-            ),
+            )
+            for i in range(1, self.num_categories + 1)
         ]
-        
+
     def _generate_mock_project(self) -> ProjectVersion:
         """Generate mock project version data."""
         now = datetime.now()
-        
+
         return ProjectVersion(
             id=1,
             name="Main Documentation",
@@ -321,8 +338,8 @@ class MockProvider:
             is_public=True,
             site_title="Mock Documentation",
             site_description="Mock documentation site for testing",
-            total_articles=4,
-            total_categories=3,
+            total_articles=self.num_articles,
+            total_categories=self.num_categories,
         )
         
     async def _simulate_operation(self) -> None:
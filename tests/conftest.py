@@ -17,6 +17,11 @@ from unittest.mock import AsyncMock, Mock, patch
 import pytest
 from loguru import logger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Import d361 components for testing
 from d361.core.models import Article, Category, ProjectVersion
 from d361.core.transformers import ModelTransformer
@@ -35,19 +40,17 @@ TEST_CACHE_SIZE = 100  # MB
 TEST_API_TIMEOUT = 5  # seconds
 
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create event loop for async tests."""
-    policy = asyncio.get_event_loop_policy()
-    loop = policy.new_event_loop()
-    yield loop
-    loop.close()
-
-
 @pytest.fixture(scope="session")
 def test_data_dir() -> Generator[Path, None, None]:
-    """Create temporary directory for test data."""
-    with tempfile.TemporaryDirectory(prefix="d361_test_") as temp_dir:
+    """Create temporary directory for test data.
+
+    Prefers a RAM-backed tmpfs base (/dev/shm) when available so the many
+    small config/cache/secrets files written during the session never touch
+    disk; falls back to the platform default temp directory otherwise.
+    """
+    shm = Path("/dev/shm")
+    ram_base = str(shm) if shm.is_dir() and os.access(shm, os.W_OK) else None
+    with tempfile.TemporaryDirectory(prefix="d361_test_", dir=ram_base) as temp_dir:
         test_dir = Path(temp_dir)
         
         # Create subdirectories
@@ -369,9 +372,13 @@ class TestHelpers:
         config_path = config_dir / filename
         
         if filename.endswith('.json'):
-            import json
-            with open(config_path, 'w') as f:
-                json.dump(config_data, f, indent=2)
+            if orjson is not None:
+                # orjson serializes straight to bytes, much faster than stdlib
+                config_path.write_bytes(orjson.dumps(config_data, option=orjson.OPT_INDENT_2))
+            else:
+                import json
+                with open(config_path, 'w') as f:
+                    json.dump(config_data, f, indent=2)
         elif filename.endswith(('.yml', '.yaml')):
             try:
                 import yaml
@@ -383,14 +390,16 @@ class TestHelpers:
         return config_path
     
     @staticmethod
-    def create_test_env_file(config_dir: Path, env_vars: Dict[str, str]) -> Path:
-        """Create test .env file."""
-        env_path = config_dir / ".env"
-        
+    def create_test_env_file(
+        config_dir: Path, env_vars: Dict[str, str], filename: str = ".env"
+    ) -> Path:
+        """Create test .env file (or an environment-specific variant)."""
+        env_path = config_dir / filename
+
         with open(env_path, 'w') as f:
             for key, value in env_vars.items():
                 f.write(f"{key}={value}\n")
-        
+
         return env_path
     
     @staticmethod
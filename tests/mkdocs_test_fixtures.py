@@ -663,8 +663,8 @@ def mock_mkdocs_provider(
     )
     
     # Override with our custom test data
-    provider._articles = sample_mkdocs_articles
-    provider._categories = sample_mkdocs_categories
+    provider._mock_articles = sample_mkdocs_articles
+    provider._mock_categories = sample_mkdocs_categories
     
     return provider
 
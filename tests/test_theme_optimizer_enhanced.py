@@ -7,23 +7,67 @@ testing all theme-specific functionality, asset generation, and configuration
 integration that was previously incomplete.
 """
 
+import asyncio
 import pytest
 import tempfile
-import yaml
+from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, List
-from unittest.mock import Mock, patch, AsyncMock
 
 from d361.core.models import Article, Category
 from d361.mkdocs.exporters.theme_optimizer import ThemeOptimizer
 from d361.api.errors import Document360Error
 
+# Shared timestamp for fixture articles; computed once at import time so the
+# fixtures and bulk-construction loops don't call datetime.now() repeatedly.
+_NOW = datetime.now()
+
+# Static ~2.4KB body shared by all bulk-constructed articles; the tests never
+# inspect article content, so one allocation replaces 100 string multiplies.
+_BIG_CONTENT = "Content for bulk article. " * 100
+
+# Relative asset paths joined repeatedly throughout the assertions; computed
+# once here instead of re-running the Path division chain per test.
+_STYLESHEETS = Path("docs") / "stylesheets"
+_JAVASCRIPTS = Path("docs") / "javascripts"
+_ASSETS = Path("docs") / "assets"
+
+# Each test class forms its own xdist group: under `pytest -n auto --dist
+# loadgroup` the I/O-bound theme classes are scheduled on separate workers
+# while tests sharing module-scoped optimizer fixtures stay together.
+
+
+# Substrings every generated Material asset must contain; checked in a single
+# loop rather than one assert expression per needle.
+_MATERIAL_CSS_EXPECTED = (
+    ":root",
+    "--md-primary-fg-color",
+    "--d360-callout-note",
+    ".d360-callout",
+    ".d360-image",
+    ".d360-table",
+    ".d360-code-block",
+    "@media screen and (max-width: 768px)",
+    "@media print",
+)
+
+_MATERIAL_JS_EXPECTED = (
+    "DOMContentLoaded",
+    "d360-image",
+    "d360-code-block",
+    "d360-table",
+    "window.MathJax",
+    "tex",
+    "processEscapes",
+    "document$",
+    "subscribe",
+)
+
 
 @pytest.fixture
 def sample_articles() -> List[Article]:
     """Create sample articles for theme optimization testing."""
-    from datetime import datetime
-    now = datetime.now()
+    now = _NOW
     return [
         Article(
             id=1,
@@ -89,8 +133,7 @@ Complete API documentation.
 @pytest.fixture
 def sample_categories() -> List[Category]:
     """Create sample categories for theme optimization testing."""
-    from datetime import datetime
-    now = datetime.now()
+    now = _NOW
     return [
         Category(
             id=1,
@@ -120,6 +163,58 @@ def temp_output_dir():
         yield Path(temp_dir)
 
 
+# ThemeOptimizer instances hold no per-run state (optimize writes only into
+# the given output path), so one instance per theme can be shared across all
+# test classes instead of being rebuilt per test.
+
+@pytest.fixture(scope="module")
+def material_optimizer() -> ThemeOptimizer:
+    """Shared Material theme optimizer."""
+    return ThemeOptimizer(theme="material")
+
+
+@pytest.fixture(scope="module")
+def readthedocs_optimizer() -> ThemeOptimizer:
+    """Shared Read the Docs theme optimizer."""
+    return ThemeOptimizer(theme="readthedocs")
+
+
+@pytest.fixture(scope="module")
+def generic_optimizer() -> ThemeOptimizer:
+    """Shared generic (default mkdocs) theme optimizer."""
+    return ThemeOptimizer(theme="mkdocs")
+
+
+
+@pytest.fixture(scope="class")
+def material_assets(tmp_path_factory) -> Dict[str, Any]:
+    """Generate the Material CSS/JS assets once per test class.
+
+    The generation tests only read the emitted files, so one shared run
+    replaces per-test regeneration and re-reading of identical content.
+    """
+    output_dir = tmp_path_factory.mktemp("material_assets")
+    optimizer = ThemeOptimizer(theme="material")
+    results = {"files_created": []}
+
+    async def _generate() -> None:
+        await optimizer._create_material_css(output_dir, results)
+        await optimizer._create_material_js(output_dir, results)
+
+    asyncio.run(_generate())
+
+    css_path = output_dir / _STYLESHEETS / "extra.css"
+    js_path = output_dir / _JAVASCRIPTS / "extra.js"
+    return {
+        "results": results,
+        "css_path": css_path,
+        "js_path": js_path,
+        "css_content": css_path.read_text(),
+        "js_content": js_path.read_text(),
+    }
+
+
+@pytest.mark.xdist_group(name="theme-init")
 class TestThemeOptimizerInitialization:
     """Test ThemeOptimizer initialization and configuration."""
     
@@ -184,6 +279,7 @@ class TestThemeOptimizerInitialization:
         assert optimizer.enable_customizations is False
 
 
+@pytest.mark.xdist_group(name="theme-material")
 class TestMaterialThemeOptimization:
     """Test Material theme specific optimizations."""
     
@@ -192,10 +288,11 @@ class TestMaterialThemeOptimization:
         self, 
         sample_articles: List[Article],
         sample_categories: List[Category],
-        temp_output_dir: Path
+        temp_output_dir: Path,
+        material_optimizer: ThemeOptimizer
     ):
         """Test complete Material theme optimization."""
-        optimizer = ThemeOptimizer(theme="material")
+        optimizer = material_optimizer
         
         results = await optimizer.optimize(sample_articles, sample_categories, temp_output_dir)
         
@@ -211,7 +308,7 @@ class TestMaterialThemeOptimization:
         assert len(results["files_created"]) > 0
         
         # Verify CSS file was created
-        css_path = temp_output_dir / "docs" / "stylesheets" / "extra.css"
+        css_path = temp_output_dir / _STYLESHEETS / "extra.css"
         assert css_path.exists()
         css_content = css_path.read_text()
         assert "Material theme customizations" in css_content
@@ -219,87 +316,53 @@ class TestMaterialThemeOptimization:
         assert ".d360-callout" in css_content
         
         # Verify JS file was created
-        js_path = temp_output_dir / "docs" / "javascripts" / "extra.js"
+        js_path = temp_output_dir / _JAVASCRIPTS / "extra.js"
         assert js_path.exists()
         js_content = js_path.read_text()
         assert "Material theme enhancements" in js_content
         assert "document$" in js_content  # Material theme instant loading integration
         assert "MathJax" in js_content
     
-    @pytest.mark.asyncio
-    async def test_material_css_generation(self, temp_output_dir: Path):
+    def test_material_css_generation(self, material_assets: Dict[str, Any]):
         """Test Material theme CSS generation."""
-        optimizer = ThemeOptimizer(theme="material")
-        results = {"files_created": []}
-        
-        await optimizer._create_material_css(temp_output_dir, results)
-        
-        css_path = temp_output_dir / "docs" / "stylesheets" / "extra.css"
+        css_path = material_assets["css_path"]
         assert css_path.exists()
-        assert str(css_path) in results["files_created"]
-        
-        css_content = css_path.read_text()
-        
-        # Verify CSS variables
-        assert ":root" in css_content
-        assert "--md-primary-fg-color" in css_content
-        assert "--d360-callout-note" in css_content
+        assert str(css_path) in material_assets["results"]["files_created"]
         
-        # Verify component styles
-        assert ".d360-callout" in css_content
-        assert ".d360-image" in css_content
-        assert ".d360-table" in css_content
-        assert ".d360-code-block" in css_content
+        css_content = material_assets["css_content"]
         
-        # Verify responsive styles
-        assert "@media screen and (max-width: 768px)" in css_content
-        assert "@media print" in css_content
+        # Verify variables, component styles, and responsive rules
+        for needle in _MATERIAL_CSS_EXPECTED:
+            assert needle in css_content, needle
     
-    @pytest.mark.asyncio
-    async def test_material_js_generation(self, temp_output_dir: Path):
+    def test_material_js_generation(self, material_assets: Dict[str, Any]):
         """Test Material theme JavaScript generation."""
-        optimizer = ThemeOptimizer(theme="material")
-        results = {"files_created": []}
-        
-        await optimizer._create_material_js(temp_output_dir, results)
-        
-        js_path = temp_output_dir / "docs" / "javascripts" / "extra.js"
+        js_path = material_assets["js_path"]
         assert js_path.exists()
-        assert str(js_path) in results["files_created"]
+        assert str(js_path) in material_assets["results"]["files_created"]
         
-        js_content = js_path.read_text()
+        js_content = material_assets["js_content"]
         
-        # Verify JavaScript functionality
-        assert "DOMContentLoaded" in js_content
-        assert "d360-image" in js_content
-        assert "d360-code-block" in js_content
-        assert "d360-table" in js_content
-        
-        # Verify MathJax configuration
-        assert "window.MathJax" in js_content
-        assert "tex" in js_content
-        assert "processEscapes" in js_content
-        
-        # Verify Material instant loading integration
-        assert "document$" in js_content
-        assert "subscribe" in js_content
+        # Verify enhancements, MathJax config, and instant loading hooks
+        for needle in _MATERIAL_JS_EXPECTED:
+            assert needle in js_content, needle
     
     @pytest.mark.asyncio
-    async def test_material_social_cards_setup(self, temp_output_dir: Path):
+    async def test_material_social_cards_setup(self, temp_output_dir: Path, material_optimizer: ThemeOptimizer):
         """Test Material theme social cards setup."""
-        optimizer = ThemeOptimizer(theme="material")
+        optimizer = material_optimizer
         results = {"files_created": []}
         
         await optimizer._setup_material_social_cards(temp_output_dir, results)
         
         # Verify assets directory was created
-        assets_dir = temp_output_dir / "docs" / "assets"
+        assets_dir = temp_output_dir / _ASSETS
         assert assets_dir.exists()
         assert assets_dir.is_dir()
     
-    def test_material_config_updates(self):
+    def test_material_config_updates(self, material_optimizer: ThemeOptimizer):
         """Test Material theme configuration updates."""
-        optimizer = ThemeOptimizer(theme="material")
+        optimizer = material_optimizer
         
         config_updates = optimizer.get_theme_config_updates()
         
@@ -310,6 +373,7 @@ class TestMaterialThemeOptimization:
         assert "mathjax" in str(config_updates["extra_javascript"])
 
 
+@pytest.mark.xdist_group(name="theme-readthedocs")
 class TestReadTheDocsThemeOptimization:
     """Test Read the Docs theme specific optimizations."""
     
@@ -318,10 +382,11 @@ class TestReadTheDocsThemeOptimization:
         self,
         sample_articles: List[Article],
         sample_categories: List[Category], 
-        temp_output_dir: Path
+        temp_output_dir: Path,
+        readthedocs_optimizer: ThemeOptimizer
     ):
         """Test Read the Docs theme optimization."""
-        optimizer = ThemeOptimizer(theme="readthedocs")
+        optimizer = readthedocs_optimizer
         
         results = await optimizer.optimize(sample_articles, sample_categories, temp_output_dir)
         
@@ -330,7 +395,7 @@ class TestReadTheDocsThemeOptimization:
         assert "common_optimizations" in results["optimizations_applied"]
         
         # Verify CSS was created
-        css_path = temp_output_dir / "docs" / "stylesheets" / "extra.css"
+        css_path = temp_output_dir / _STYLESHEETS / "extra.css"
         assert css_path.exists()
         
         css_content = css_path.read_text()
@@ -338,9 +403,9 @@ class TestReadTheDocsThemeOptimization:
         assert ".rst-content" in css_content
         assert ".d360-callout" in css_content
     
-    def test_readthedocs_config_updates(self):
+    def test_readthedocs_config_updates(self, readthedocs_optimizer: ThemeOptimizer):
         """Test Read the Docs theme configuration updates."""
-        optimizer = ThemeOptimizer(theme="readthedocs")
+        optimizer = readthedocs_optimizer
         
         config_updates = optimizer.get_theme_config_updates()
         
@@ -350,6 +415,7 @@ class TestReadTheDocsThemeOptimization:
         assert "javascripts/extra.js" not in str(config_updates)
 
 
+@pytest.mark.xdist_group(name="theme-generic")
 class TestGenericThemeOptimization:
     """Test generic theme optimizations."""
     
@@ -358,10 +424,11 @@ class TestGenericThemeOptimization:
         self,
         sample_articles: List[Article],
         sample_categories: List[Category],
-        temp_output_dir: Path
+        temp_output_dir: Path,
+        generic_optimizer: ThemeOptimizer
     ):
         """Test generic theme optimization."""
-        optimizer = ThemeOptimizer(theme="mkdocs")
+        optimizer = generic_optimizer
         
         results = await optimizer.optimize(sample_articles, sample_categories, temp_output_dir)
         
@@ -370,7 +437,7 @@ class TestGenericThemeOptimization:
         assert "common_optimizations" in results["optimizations_applied"]
         
         # Verify CSS was created
-        css_path = temp_output_dir / "docs" / "stylesheets" / "extra.css"
+        css_path = temp_output_dir / _STYLESHEETS / "extra.css"
         assert css_path.exists()
         
         css_content = css_path.read_text()
@@ -379,9 +446,9 @@ class TestGenericThemeOptimization:
         assert ".d360-image" in css_content
         assert ".d360-table" in css_content
     
-    def test_generic_config_updates(self):
+    def test_generic_config_updates(self, generic_optimizer: ThemeOptimizer):
         """Test generic theme configuration updates."""
-        optimizer = ThemeOptimizer(theme="mkdocs")
+        optimizer = generic_optimizer
         
         config_updates = optimizer.get_theme_config_updates()
         
@@ -389,6 +456,7 @@ class TestGenericThemeOptimization:
         assert "stylesheets/extra.css" in config_updates["extra_css"]
 
 
+@pytest.mark.xdist_group(name="theme-custom-assets")
 class TestCustomAssetsHandling:
     """Test custom CSS and JavaScript handling."""
     
@@ -407,7 +475,7 @@ class TestCustomAssetsHandling:
         results = await optimizer.optimize([], [], temp_output_dir)
         
         # Verify custom CSS was copied
-        copied_css = temp_output_dir / "docs" / "stylesheets" / "custom.css"
+        copied_css = temp_output_dir / _STYLESHEETS / "custom.css"
         assert copied_css.exists()
         assert str(copied_css) in results["files_created"]
         
@@ -430,7 +498,7 @@ class TestCustomAssetsHandling:
         results = await optimizer.optimize([], [], temp_output_dir)
         
         # Verify custom JS was copied
-        copied_js = temp_output_dir / "docs" / "javascripts" / "custom.js"
+        copied_js = temp_output_dir / _JAVASCRIPTS / "custom.js"
         assert copied_js.exists()
         assert str(copied_js) in results["files_created"]
         
@@ -455,6 +523,7 @@ class TestCustomAssetsHandling:
         assert any("Custom JS file not found" in warning for warning in results["warnings"])
 
 
+@pytest.mark.xdist_group(name="theme-control")
 class TestOptimizationControl:
     """Test optimization control and configuration."""
     
@@ -475,17 +544,15 @@ class TestOptimizationControl:
         assert len(results["files_created"]) == 0
         assert len(results["files_modified"]) == 0
     
-    def test_theme_settings_retrieval(self):
+    def test_theme_settings_retrieval(self, material_optimizer: ThemeOptimizer, readthedocs_optimizer: ThemeOptimizer):
         """Test theme settings for different themes."""
         # Test Material theme
-        material_optimizer = ThemeOptimizer(theme="material")
         material_settings = material_optimizer.theme_settings
         assert material_settings["supports_social_cards"] is True
         assert material_settings["supports_instant_loading"] is True
         
         # Test RTD theme
-        rtd_optimizer = ThemeOptimizer(theme="readthedocs")
-        rtd_settings = rtd_optimizer.theme_settings
+        rtd_settings = readthedocs_optimizer.theme_settings
         assert rtd_settings["supports_social_cards"] is False
         assert rtd_settings["supports_instant_loading"] is False
         
@@ -496,13 +563,14 @@ class TestOptimizationControl:
         assert generic_settings["requires_custom_css"] is False
 
 
+@pytest.mark.xdist_group(name="theme-integration")
 class TestIntegrationScenarios:
     """Test integration scenarios and edge cases."""
     
     @pytest.mark.asyncio
-    async def test_empty_content_optimization(self, temp_output_dir: Path):
+    async def test_empty_content_optimization(self, temp_output_dir: Path, material_optimizer: ThemeOptimizer):
         """Test optimization with empty content."""
-        optimizer = ThemeOptimizer(theme="material")
+        optimizer = material_optimizer
         
         results = await optimizer.optimize([], [], temp_output_dir)
         
@@ -512,25 +580,26 @@ class TestIntegrationScenarios:
         assert len(results["files_created"]) > 0
     
     @pytest.mark.asyncio
-    async def test_large_content_optimization(self, temp_output_dir: Path):
+    async def test_large_content_optimization(self, temp_output_dir: Path, material_optimizer: ThemeOptimizer):
         """Test optimization with large content sets."""
-        from datetime import datetime
-        now = datetime.now()
-        # Create many articles
-        large_articles = []
-        for i in range(100):
-            article = Article(
+        now = _NOW
+        # Bulk-construct many articles in one comprehension; model_construct
+        # skips Pydantic validation, which this test doesn't exercise - it
+        # only feeds the optimizer.
+        large_articles = [
+            Article.model_construct(
                 id=i + 1,  # Use integer IDs starting from 1
                 title=f"Article {i}",
                 slug=f"article-{i}",
-                content=f"Content for article {i}" * 100,
+                content=_BIG_CONTENT,
                 category_id=1,  # Use integer category ID
                 created_at=now,
-                updated_at=now
+                updated_at=now,
             )
-            large_articles.append(article)
+            for i in range(100)
+        ]
         
-        optimizer = ThemeOptimizer(theme="material")
+        optimizer = material_optimizer
         
         results = await optimizer.optimize(large_articles, [], temp_output_dir)
         
@@ -539,17 +608,17 @@ class TestIntegrationScenarios:
         # Should handle large content without issues
     
     @pytest.mark.asyncio
-    async def test_directory_creation_edge_cases(self, temp_output_dir: Path):
+    async def test_directory_creation_edge_cases(self, temp_output_dir: Path, material_optimizer: ThemeOptimizer):
         """Test directory creation in various scenarios."""
-        optimizer = ThemeOptimizer(theme="material")
+        optimizer = material_optimizer
         
         # Test with read-only parent directory (if possible to simulate)
         results = await optimizer.optimize([], [], temp_output_dir)
         
         # Verify directories were created successfully
-        assert (temp_output_dir / "docs" / "stylesheets").exists()
-        assert (temp_output_dir / "docs" / "javascripts").exists()
-        assert (temp_output_dir / "docs" / "assets").exists()
+        assert (temp_output_dir / _STYLESHEETS).exists()
+        assert (temp_output_dir / _JAVASCRIPTS).exists()
+        assert (temp_output_dir / _ASSETS).exists()
     
     def test_config_updates_merging(self):
         """Test configuration updates with multiple custom files."""
@@ -6,11 +6,13 @@ This module provides thorough testing of the configuration management,
 secrets handling, environment loading, and validation components.
 """
 
+import asyncio
 import os
 import json
 import tempfile
 from pathlib import Path
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
 from unittest.mock import Mock, patch, AsyncMock
 
 import pytest
@@ -28,17 +30,41 @@ from d361.config import (
     SecretMetadata,
     SecretValue,
     EnvironmentSecretsProvider,
-    LocalFileSecretsProvider
+    LocalFileSecretsProvider,
+    SecurityConfig
 )
 from d361.api.errors import Document360Error
 
 
+
+# Environment override batches used by the patch.dict tests, built once at
+# module scope. The patch windows themselves stay per-test: AppConfig is a
+# BaseSettings subclass that reads D361_* variables, so patching a whole
+# class would leak overrides into the tests asserting default values.
+_APP_ENV_OVERRIDES = {
+    "D361_APP_NAME": "env-app",
+    "D361_DEBUG": "false",
+    "D361_API_TIMEOUT_SECONDS": "120"
+}
+
+_SECRET_ENV_OVERRIDES = {"TEST_SECRET_API_TOKEN": "test-token-123"}
+
+@pytest.fixture(scope="module")
+def default_app_config() -> AppConfig:
+    """Build the default AppConfig once for read-only assertions.
+
+    AppConfig construction runs full Pydantic validation over every nested
+    model, so tests that never mutate the instance share a single copy.
+    """
+    return AppConfig()
+
+
 class TestAppConfig:
     """Test cases for AppConfig model."""
 
-    def test_app_config_creation_defaults(self):
+    def test_app_config_creation_defaults(self, default_app_config: AppConfig):
         """Test AppConfig creation with default values."""
-        config = AppConfig()
+        config = default_app_config
         
         assert config.app_name == "d361"
         assert config.version == "1.0.0"
@@ -47,14 +73,14 @@ class TestAppConfig:
 
     def test_app_config_environment_override(self):
         """Test environment-specific configuration."""
-        config = AppConfig(environment=Environment.PRODUCTION)
+        config = AppConfig.model_construct(environment=Environment.PRODUCTION)
         
         assert config.environment == Environment.PRODUCTION
         # Production-specific defaults should be applied
 
-    def test_app_config_nested_models(self):
+    def test_app_config_nested_models(self, default_app_config: AppConfig):
         """Test nested configuration models."""
-        config = AppConfig()
+        config = default_app_config
         
         # Test API config
         assert config.api.timeout_seconds == 30
@@ -69,9 +95,9 @@ class TestAppConfig:
         assert config.monitoring.metrics_enabled is True
         assert config.monitoring.log_level.value == "INFO"
 
-    def test_app_config_validation(self):
+    def test_app_config_validation(self, default_app_config: AppConfig):
         """Test AppConfig validation rules."""
-        config = AppConfig()
+        config = default_app_config
         
         # Test validation method
         issues = config.validate_configuration()
@@ -87,18 +113,18 @@ class TestAppConfig:
         debug_issues = [issue for issue in issues if "debug" in issue.lower()]
         # Depending on implementation, may or may not have debug warning
 
-    def test_app_config_feature_flags(self):
+    def test_app_config_feature_flags(self, default_app_config: AppConfig):
         """Test feature flag functionality."""
-        config = AppConfig()
+        config = default_app_config
         
         # Test default features
         assert config.get_feature_flag("api_client") is True
         assert config.get_feature_flag("archive_processing") is True
         assert config.get_feature_flag("non_existent_feature", default=False) is False
 
-    def test_app_config_serialization(self):
+    def test_app_config_serialization(self, default_app_config: AppConfig):
         """Test configuration serialization."""
-        config = AppConfig()
+        config = default_app_config
         
         # Test dict conversion
         config_dict = config.to_dict()
@@ -130,11 +156,7 @@ class TestAppConfig:
 
     def test_app_config_environment_variables(self):
         """Test configuration from environment variables."""
-        with patch.dict(os.environ, {
-            "D361_APP_NAME": "env-app",
-            "D361_DEBUG": "false",
-            "D361_API_TIMEOUT_SECONDS": "120"
-        }):
+        with patch.dict(os.environ, _APP_ENV_OVERRIDES):
             config = AppConfig()
             
             # Should pick up environment variables
@@ -144,52 +166,55 @@ class TestAppConfig:
 class TestEnvironmentLoader:
     """Test cases for EnvironmentLoader."""
 
-    def test_environment_detection(self, test_data_dir):
-        """Test environment detection logic."""
-        loader = EnvironmentLoader(test_data_dir)
-        
-        # Default should be development
-        env = loader.detect_environment()
-        assert env == Environment.DEVELOPMENT
-
-    def test_environment_detection_with_override(self, test_data_dir):
-        """Test environment detection with override."""
-        loader = EnvironmentLoader(test_data_dir, environment_override="production")
-        
-        env = loader.detect_environment()
-        assert env == Environment.PRODUCTION
-
-    def test_environment_detection_from_env_var(self, test_data_dir):
-        """Test environment detection from environment variable."""
-        with patch.dict(os.environ, {"D361_ENVIRONMENT": "staging"}):
-            loader = EnvironmentLoader(test_data_dir)
-            env = loader.detect_environment()
-            assert env == Environment.STAGING
-
-    def test_dotenv_file_loading(self, test_data_dir, test_helpers):
-        """Test .env file loading."""
-        # Create test .env file
-        env_vars = {
-            "TEST_VAR": "test_value",
-            "QUOTED_VAR": '"quoted_value"',
-            "NUMBER_VAR": "123"
-        }
-        test_helpers.create_test_env_file(test_data_dir, env_vars)
-        
-        loader = EnvironmentLoader(test_data_dir)
-        loaded_vars = loader.load_dotenv_file(test_data_dir / ".env")
-        
-        assert loaded_vars["TEST_VAR"] == "test_value"
-        assert loaded_vars["QUOTED_VAR"] == "quoted_value"  # Quotes removed
-        assert loaded_vars["NUMBER_VAR"] == "123"
+    @pytest.mark.parametrize(
+        "override,env_var,expected",
+        [
+            pytest.param(None, None, Environment.DEVELOPMENT, id="default"),
+            pytest.param("production", None, Environment.PRODUCTION, id="override"),
+            pytest.param(None, "staging", Environment.STAGING, id="env-var"),
+        ],
+    )
+    def test_environment_detection(self, tmp_path, monkeypatch, override, env_var, expected):
+        """Test environment detection: default, explicit override, env var."""
+        if env_var:
+            monkeypatch.setenv("D361_ENVIRONMENT", env_var)
+        else:
+            monkeypatch.delenv("D361_ENVIRONMENT", raising=False)
+
+        loader = EnvironmentLoader(tmp_path, environment_override=override)
+        assert loader.detect_environment() == expected
+
+    # Corpus of raw .env lines and their expected parsed values, covering
+    # plain, quoted, numeric, URL, and spaced cases in one bulk load.
+    _DOTENV_CORPUS = {
+        "TEST_VAR": ("test_value", "test_value"),
+        "QUOTED_VAR": ('"quoted_value"', "quoted_value"),
+        "SINGLE_QUOTED_VAR": ("'single_value'", "single_value"),
+        "NUMBER_VAR": ("123", "123"),
+        "URL_VAR": ("https://example.com/path?a=1&b=2", "https://example.com/path?a=1&b=2"),
+        "SPACED_VAR": ("value with spaces", "value with spaces"),
+        "EQUALS_VAR": ("key=value", "key=value"),
+    }
+
+    def test_dotenv_file_loading(self, tmp_path, test_helpers):
+        """Test .env file loading against the whole corpus in one pass."""
+        test_helpers.create_test_env_file(
+            tmp_path, {key: raw for key, (raw, _) in self._DOTENV_CORPUS.items()}
+        )
+
+        loader = EnvironmentLoader(tmp_path)
+        loaded_vars = loader.load_dotenv_file(tmp_path / ".env")
 
-    def test_config_file_paths(self, test_data_dir, test_helpers):
+        for key, (_, expected) in self._DOTENV_CORPUS.items():
+            assert loaded_vars[key] == expected, key
+
+    def test_config_file_paths(self, tmp_path, test_helpers):
         """Test configuration file path detection."""
         # Create test config files
-        test_helpers.create_test_config_file(test_data_dir, "config.yaml", {"test": "value"})
-        test_helpers.create_test_config_file(test_data_dir, "config.production.yaml", {"prod": "value"})
+        test_helpers.create_test_config_file(tmp_path, "config.yaml", {"test": "value"})
+        test_helpers.create_test_config_file(tmp_path, "config.production.yaml", {"prod": "value"})
         
-        loader = EnvironmentLoader(test_data_dir)
+        loader = EnvironmentLoader(tmp_path)
         
         config_paths = loader.get_config_file_paths(Environment.PRODUCTION)
         assert len(config_paths) >= 1
@@ -198,13 +223,15 @@ class TestEnvironmentLoader:
         prod_config = any("production" in str(path) for path in config_paths)
         assert prod_config
 
-    def test_env_file_paths(self, test_data_dir, test_helpers):
+    def test_env_file_paths(self, tmp_path, test_helpers):
         """Test .env file path detection."""
         # Create test .env files
-        test_helpers.create_test_env_file(test_data_dir, {"BASE": "value"})
-        test_helpers.create_test_env_file(test_data_dir / ".env.development", {"DEV": "value"})
+        test_helpers.create_test_env_file(tmp_path, {"BASE": "value"})
+        test_helpers.create_test_env_file(
+            tmp_path, {"DEV": "value"}, filename=".env.development"
+        )
         
-        loader = EnvironmentLoader(test_data_dir)
+        loader = EnvironmentLoader(tmp_path)
         
         env_paths = loader.get_env_file_paths(Environment.DEVELOPMENT)
         assert len(env_paths) >= 1
@@ -214,25 +241,28 @@ class TestEnvironmentLoader:
         assert has_base
 
     @pytest.mark.asyncio
-    async def test_configuration_loading(self, test_data_dir, test_helpers):
+    async def test_configuration_loading(self, tmp_path, test_helpers):
         """Test complete configuration loading."""
         # Create test configuration
         config_data = {
             "app_name": "test-app",
             "debug": True
         }
-        test_helpers.create_test_config_file(test_data_dir, "config.yaml", config_data)
+        test_helpers.create_test_config_file(tmp_path, "config.yaml", config_data)
         
-        loader = EnvironmentLoader(test_data_dir)
+        loader = EnvironmentLoader(tmp_path)
         config = loader.load_configuration(Environment.TESTING)
         
         assert isinstance(config, AppConfig)
         assert config.environment == Environment.TESTING
 
-    def test_hot_reload_setup(self, test_data_dir):
+    def test_hot_reload_setup(self, tmp_path, test_helpers):
         """Test hot-reload functionality setup."""
-        loader = EnvironmentLoader(test_data_dir)
-        
+        # Hot reload only watches existing files, so create one up front
+        # instead of relying on files left behind by earlier tests.
+        test_helpers.create_test_config_file(tmp_path, "config.yaml", {"app_name": "reload-test"})
+        loader = EnvironmentLoader(tmp_path)
+
         # Create test config for reloading
         test_config = AppConfig(environment=Environment.DEVELOPMENT)
         loader._current_config = test_config
@@ -244,9 +274,9 @@ class TestEnvironmentLoader:
         # Note: Actual file change testing would be complex
         assert loader._observer is not None or loader._current_config.is_production()
 
-    def test_config_summary(self, test_data_dir):
+    def test_config_summary(self, tmp_path):
         """Test configuration summary generation."""
-        loader = EnvironmentLoader(test_data_dir)
+        loader = EnvironmentLoader(tmp_path)
         
         summary = loader.get_config_summary()
         
@@ -259,37 +289,41 @@ class TestEnvironmentLoader:
 class TestSecretsProviders:
     """Test cases for secrets providers."""
 
+    @pytest.fixture(scope="class")
+    def env_provider(self) -> EnvironmentSecretsProvider:
+        """Initialize one environment provider for the whole class.
+
+        The provider is stateless beyond its prefix, so the get/missing/
+        health-check tests don't each need their own initialize round-trip.
+        """
+        provider = EnvironmentSecretsProvider({"prefix": "TEST_SECRET_"})
+        asyncio.run(provider.initialize())
+        return provider
+
     @pytest.mark.asyncio
-    async def test_environment_secrets_provider(self):
+    async def test_environment_secrets_provider(self, env_provider):
         """Test environment variables secrets provider."""
-        config = {"prefix": "TEST_SECRET_"}
-        provider = EnvironmentSecretsProvider(config)
-        
-        await provider.initialize()
-        assert provider._is_initialized
+        assert env_provider._is_initialized
 
         # Test setting and getting secret
-        with patch.dict(os.environ, {"TEST_SECRET_API_TOKEN": "test-token-123"}):
-            secret = await provider.get_secret("api_token")
+        with patch.dict(os.environ, _SECRET_ENV_OVERRIDES):
+            secret = await env_provider.get_secret("api_token")
             
             assert secret.value == "test-token-123"
             assert secret.metadata.secret_id == "api_token"
 
     @pytest.mark.asyncio
-    async def test_environment_secrets_provider_missing_secret(self):
+    async def test_environment_secrets_provider_missing_secret(self, env_provider):
         """Test environment provider with missing secret."""
-        provider = EnvironmentSecretsProvider({"prefix": "MISSING_"})
-        await provider.initialize()
-        
         with pytest.raises(Document360Error) as exc_info:
-            await provider.get_secret("nonexistent")
+            await env_provider.get_secret("nonexistent")
         
         assert "not found" in str(exc_info.value)
 
     @pytest.mark.asyncio
-    async def test_local_file_secrets_provider(self, test_data_dir):
+    async def test_local_file_secrets_provider(self, tmp_path):
         """Test local file secrets provider."""
-        secrets_dir = test_data_dir / "secrets"
+        secrets_dir = tmp_path / "secrets"
         secrets_dir.mkdir(exist_ok=True)
         
         config = {"secrets_dir": secrets_dir}
@@ -315,9 +349,9 @@ class TestSecretsProviders:
         assert secret.metadata.secret_type == SecretType.API_TOKEN
 
     @pytest.mark.asyncio
-    async def test_local_file_secrets_provider_list(self, test_data_dir):
+    async def test_local_file_secrets_provider_list(self, tmp_path):
         """Test listing secrets from local file provider."""
-        secrets_dir = test_data_dir / "secrets"
+        secrets_dir = tmp_path / "secrets"
         provider = LocalFileSecretsProvider({"secrets_dir": secrets_dir})
         await provider.initialize()
 
@@ -335,15 +369,13 @@ class TestSecretsProviders:
         assert api_secrets[0].secret_type == SecretType.API_TOKEN
 
     @pytest.mark.asyncio
-    async def test_secrets_provider_health_check(self, test_data_dir):
+    async def test_secrets_provider_health_check(self, tmp_path, env_provider):
         """Test secrets provider health checks."""
-        # Environment provider
-        env_provider = EnvironmentSecretsProvider({})
-        await env_provider.initialize()
+        # Environment provider (shared, already initialized)
         assert await env_provider.health_check() is True
 
         # Local file provider
-        file_provider = LocalFileSecretsProvider({"secrets_dir": test_data_dir / "secrets"})
+        file_provider = LocalFileSecretsProvider({"secrets_dir": tmp_path / "secrets"})
         await file_provider.initialize()
         assert await file_provider.health_check() is True
 
@@ -351,21 +383,31 @@ class TestSecretsProviders:
 class TestSecretsManager:
     """Test cases for SecretsManager."""
 
-    @pytest.mark.asyncio
-    async def test_secrets_manager_initialization(self, test_data_dir):
-        """Test secrets manager initialization."""
-        from d361.config import SecurityConfig
-        
-        security_config = SecurityConfig(
+    @pytest.fixture(scope="class")
+    def local_security_config(self, tmp_path_factory):
+        """Build the local-file SecurityConfig once for the whole class."""
+        return SecurityConfig(
             secrets_provider=SecretProvider.LOCAL_FILE,
-            secrets_config={"secrets_dir": test_data_dir / "secrets"}
+            secrets_config={"secrets_dir": tmp_path_factory.mktemp("secrets")}
         )
-        
-        manager = SecretsManager(security_config)
-        await manager.initialize()
-        
-        assert manager._is_initialized
-        assert manager._primary_provider is not None
+
+    @pytest.fixture(scope="class")
+    def initialized_manager(self, local_security_config):
+        """Build and initialize one SecretsManager for the whole class.
+
+        Initialization wires up the primary and fallback providers, which is
+        identical for every test here; the manager holds no event-loop-bound
+        state, so one asyncio.run bootstrap can serve all the async tests.
+        """
+        manager = SecretsManager(local_security_config)
+        asyncio.run(manager.initialize())
+        return manager
+
+    @pytest.mark.asyncio
+    async def test_secrets_manager_initialization(self, initialized_manager):
+        """Test secrets manager initialization."""
+        assert initialized_manager._is_initialized
+        assert initialized_manager._primary_provider is not None
 
     @pytest.mark.asyncio
     async def test_secrets_manager_auto_detection(self):
@@ -377,36 +419,16 @@ class TestSecretsManager:
         assert detected_provider == SecretProvider.ENVIRONMENT
 
     @pytest.mark.asyncio
-    async def test_secrets_manager_fallback(self, test_data_dir):
+    async def test_secrets_manager_fallback(self, initialized_manager):
         """Test fallback provider functionality."""
-        from d361.config import SecurityConfig
-        
-        security_config = SecurityConfig(
-            secrets_provider=SecretProvider.LOCAL_FILE,
-            secrets_config={"secrets_dir": test_data_dir / "secrets"}
-        )
-        
-        manager = SecretsManager(security_config)
-        await manager.initialize()
-        
         # Should have fallback providers
-        assert len(manager._fallback_providers) >= 1
+        assert len(initialized_manager._fallback_providers) >= 1
 
     @pytest.mark.asyncio
-    async def test_secrets_manager_secret_operations(self, test_data_dir):
+    async def test_secrets_manager_secret_operations(self, initialized_manager):
         """Test secret CRUD operations through manager."""
-        from d361.config import SecurityConfig
-        
-        security_config = SecurityConfig(
-            secrets_provider=SecretProvider.LOCAL_FILE,
-            secrets_config={"secrets_dir": test_data_dir / "secrets"}
-        )
-        
-        manager = SecretsManager(security_config)
-        await manager.initialize()
-
         # Set secret
-        metadata = await manager.set_secret(
+        metadata = await initialized_manager.set_secret(
             "test_api_token",
             "token_value_123",
             SecretType.API_TOKEN
@@ -414,49 +436,29 @@ class TestSecretsManager:
         assert metadata.secret_id == "test_api_token"
 
         # Get secret
-        secret = await manager.get_secret("test_api_token")
+        secret = await initialized_manager.get_secret("test_api_token")
         assert secret.value == "token_value_123"
 
         # List secrets
-        secrets = await manager.list_secrets()
+        secrets = await initialized_manager.list_secrets()
         assert len(secrets) >= 1
 
         # Delete secret
-        result = await manager.delete_secret("test_api_token")
+        result = await initialized_manager.delete_secret("test_api_token")
         assert result is True
 
     @pytest.mark.asyncio
-    async def test_secrets_manager_health_check(self, test_data_dir):
+    async def test_secrets_manager_health_check(self, initialized_manager):
         """Test secrets manager health monitoring."""
-        from d361.config import SecurityConfig
-        
-        security_config = SecurityConfig(
-            secrets_provider=SecretProvider.LOCAL_FILE,
-            secrets_config={"secrets_dir": test_data_dir / "secrets"}
-        )
-        
-        manager = SecretsManager(security_config)
-        await manager.initialize()
-
-        health = await manager.health_check()
+        health = await initialized_manager.health_check()
         
         assert isinstance(health, dict)
         assert any("primary_" in key for key in health.keys())
 
     @pytest.mark.asyncio
-    async def test_secrets_manager_provider_info(self, test_data_dir):
+    async def test_secrets_manager_provider_info(self, initialized_manager):
         """Test provider information retrieval."""
-        from d361.config import SecurityConfig
-        
-        security_config = SecurityConfig(
-            secrets_provider=SecretProvider.LOCAL_FILE,
-            secrets_config={"secrets_dir": test_data_dir / "secrets"}
-        )
-        
-        manager = SecretsManager(security_config)
-        await manager.initialize()
-
-        info = await manager.get_provider_info()
+        info = await initialized_manager.get_provider_info()
         
         assert "primary_provider" in info
         assert "fallback_providers" in info
@@ -467,26 +469,26 @@ class TestConfigLoader:
     """Test cases for ConfigLoader."""
 
     @pytest.mark.asyncio
-    async def test_config_loader_initialization(self, test_data_dir):
+    async def test_config_loader_initialization(self, tmp_path):
         """Test config loader initialization."""
         loader = ConfigLoader(
-            base_config_dir=test_data_dir,
+            base_config_dir=tmp_path,
             enable_secrets=False,
             enable_hot_reload=False
         )
         
-        assert loader.base_config_dir == test_data_dir
+        assert loader.base_config_dir == tmp_path
         assert loader.enable_secrets is False
 
     @pytest.mark.asyncio
-    async def test_config_loader_load_configuration(self, test_data_dir, test_helpers):
+    async def test_config_loader_load_configuration(self, tmp_path, test_helpers):
         """Test configuration loading through ConfigLoader."""
         # Create test configuration
         config_data = {"app_name": "test-app", "debug": False}
-        test_helpers.create_test_config_file(test_data_dir, "config.yaml", config_data)
+        test_helpers.create_test_config_file(tmp_path, "config.yaml", config_data)
         
         loader = ConfigLoader(
-            base_config_dir=test_data_dir,
+            base_config_dir=tmp_path,
             enable_secrets=False,
             enable_hot_reload=False
         )
@@ -496,39 +498,49 @@ class TestConfigLoader:
         assert isinstance(config, AppConfig)
         assert config.environment == Environment.TESTING
 
-    @pytest.mark.asyncio
-    async def test_config_loader_validation(self, test_data_dir):
-        """Test configuration validation through loader."""
+    @pytest.fixture(scope="class")
+    def validated_config(self, tmp_path_factory) -> AppConfig:
+        """Run a validated load_configuration once for type-only assertions."""
         loader = ConfigLoader(
-            base_config_dir=test_data_dir,
+            base_config_dir=tmp_path_factory.mktemp("loader_validation"),
             enable_secrets=False,
             enable_hot_reload=False
         )
-        
-        # Load with validation
-        config = await loader.load_configuration(Environment.TESTING, validate=True)
-        
-        assert isinstance(config, AppConfig)
+        return asyncio.run(loader.load_configuration(Environment.TESTING, validate=True))
+
+    def test_config_loader_validation(self, validated_config: AppConfig):
+        """Test configuration validation through loader."""
+        # Only the return type is asserted, so reuse the cached load
+        assert isinstance(validated_config, AppConfig)
 
     @pytest.mark.asyncio
-    async def test_config_loader_with_secrets(self, test_data_dir):
-        """Test configuration loading with secrets integration."""
-        loader = ConfigLoader(
-            base_config_dir=test_data_dir,
-            enable_secrets=True,
-            enable_hot_reload=False
-        )
-        
-        # Should initialize secrets manager
-        config = await loader.load_configuration(Environment.TESTING)
-        assert loader.secrets_manager is not None
+    async def test_config_loader_with_secrets(self, tmp_path):
+        """Test configuration loading wires up the secrets manager."""
+        # Stub out the manager: this test only cares that the loader creates
+        # and initializes one, not about real provider discovery (covered in
+        # TestSecretsManager).
+        with patch("d361.config.loader.SecretsManager") as mock_manager_cls:
+            stub = AsyncMock()
+            stub.get_secret.side_effect = KeyError("no secrets in stub")
+            mock_manager_cls.return_value = stub
+
+            loader = ConfigLoader(
+                base_config_dir=tmp_path,
+                enable_secrets=True,
+                enable_hot_reload=False
+            )
+
+            config = await loader.load_configuration(Environment.TESTING)
+            assert loader.secrets_manager is stub
+            stub.initialize.assert_awaited_once()
 
-    def test_config_loader_summary(self, test_data_dir):
+    @pytest.mark.asyncio
+    async def test_config_loader_summary(self, tmp_path):
         """Test configuration summary from loader."""
-        loader = ConfigLoader(base_config_dir=test_data_dir)
-        
-        # Get summary
-        summary = asyncio.run(loader.get_config_summary())
+        loader = ConfigLoader(base_config_dir=tmp_path)
+
+        # Get summary on the shared session loop
+        summary = await loader.get_config_summary()
         
         assert "secrets_enabled" in summary
         assert "hot_reload_enabled" in summary
@@ -548,8 +560,9 @@ class TestConfigValidator:
         """Test production-specific validation rules."""
         validator = ConfigValidator(Environment.PRODUCTION)
         
-        # Create config with production issues
-        config = AppConfig(
+        # Create config with production issues; the validator only reads
+        # attributes, so skip model validation via model_construct
+        config = AppConfig.model_construct(
             environment=Environment.PRODUCTION,
             debug=True  # Should trigger warning
         )
@@ -564,7 +577,7 @@ class TestConfigValidator:
         """Test development-specific validation."""
         validator = ConfigValidator(Environment.DEVELOPMENT)
         
-        config = AppConfig(environment=Environment.DEVELOPMENT)
+        config = AppConfig.model_construct(environment=Environment.DEVELOPMENT)
         
         issues = validator.validate(config)
         
@@ -583,7 +596,7 @@ class TestConfigValidator:
         validator.add_rule(custom_rule)
         
         # Test with invalid config
-        config = AppConfig(app_name="invalid")
+        config = AppConfig.model_construct(app_name="invalid")
         issues = validator.validate(config)
         
         custom_issues = [issue for issue in issues if "Custom rule" in issue]
@@ -594,7 +607,7 @@ class TestConfigValidator:
         validator = ConfigValidator(Environment.PRODUCTION)
         
         # Create config with excessive limits
-        config = AppConfig()
+        config = AppConfig.model_construct()
         config.cache.max_disk_size_mb = 100000  # 100GB
         config.archive.max_extracted_size_mb = 100000  # 100GB
         
@@ -608,7 +621,7 @@ class TestConfigValidator:
         """Test network settings validation."""
         validator = ConfigValidator(Environment.PRODUCTION)
         
-        config = AppConfig()
+        config = AppConfig.model_construct()
         config.api.timeout_seconds = 1  # Very short timeout
         
         issues = validator.validate(config)
@@ -621,10 +634,17 @@ class TestConfigValidator:
 class TestConfigurationEdgeCases:
     """Test edge cases and error conditions."""
 
-    def test_invalid_environment_values(self):
-        """Test handling of invalid environment values."""
+    @pytest.mark.parametrize(
+        "bad_kwargs",
+        [
+            pytest.param({"environment": "invalid_environment"}, id="invalid-environment"),
+            pytest.param({"api": {"timeout_seconds": -1}}, id="negative-timeout"),
+        ],
+    )
+    def test_invalid_config_values(self, bad_kwargs: Dict[str, Any]):
+        """Test that invalid top-level and nested values are rejected."""
         with pytest.raises(ValidationError):
-            AppConfig(environment="invalid_environment")
+            AppConfig(**bad_kwargs)
 
     def test_missing_required_fields(self):
         """Test handling of missing required configuration fields."""
@@ -635,22 +655,15 @@ class TestConfigurationEdgeCases:
         assert config.app_name is not None
         assert config.version is not None
 
-    def test_config_with_invalid_nested_values(self):
-        """Test configuration with invalid nested values."""
-        with pytest.raises(ValidationError):
-            AppConfig(
-                api={"timeout_seconds": -1}  # Invalid negative timeout
-            )
-
     @pytest.mark.asyncio
-    async def test_config_loading_with_corrupted_files(self, test_data_dir, test_helpers):
+    async def test_config_loading_with_corrupted_files(self, tmp_path, test_helpers):
         """Test configuration loading with corrupted files."""
         # Create corrupted JSON file
-        corrupted_path = test_data_dir / "config.json"
+        corrupted_path = tmp_path / "config.json"
         with open(corrupted_path, 'w') as f:
             f.write('{"invalid": json}')  # Invalid JSON
         
-        loader = EnvironmentLoader(test_data_dir)
+        loader = EnvironmentLoader(tmp_path)
         
         # Should handle corrupted files gracefully
         try:
@@ -660,13 +673,17 @@ class TestConfigurationEdgeCases:
             # Expected for corrupted config
             pass
 
+    class _FailingProvider:
+        """Concrete stand-in for a secrets provider that cannot start."""
+
+        async def initialize(self) -> None:
+            raise Exception("Provider failed")
+
     @pytest.mark.asyncio
     async def test_secrets_with_provider_failures(self):
         """Test secrets handling when provider fails."""
-        # Mock failing provider
-        failing_provider = AsyncMock()
-        failing_provider.initialize.side_effect = Exception("Provider failed")
-        
+        failing_provider = self._FailingProvider()
+
         with patch('d361.config.secrets_manager.create_secrets_provider', return_value=failing_provider):
             manager = SecretsManager()
             
@@ -690,45 +707,52 @@ class TestConfigurationEdgeCases:
             # Should be masked or empty depending on implementation
 
 
-# Fixtures for configuration testing
-@pytest.fixture
-def sample_config_data() -> Dict[str, Any]:
-    """Sample configuration data for testing."""
-    return {
-        "app_name": "test-d361",
-        "environment": "testing",
-        "debug": True,
-        "api": {
-            "timeout_seconds": 30,
-            "max_retries": 3,
-            "api_tokens": ["test-token"]
-        },
-        "cache": {
-            "enabled": True,
-            "max_memory_mb": 128
-        },
-        "monitoring": {
-            "metrics_enabled": True,
-            "log_level": "DEBUG"
-        }
+# Fixtures for configuration testing. The canonical payloads are built once
+# at module scope and handed out as read-only views; a test that needs a
+# mutable copy should take its own `dict(...)` of the fixture value.
+_SAMPLE_CONFIG: Dict[str, Any] = {
+    "app_name": "test-d361",
+    "environment": "testing",
+    "debug": True,
+    "api": {
+        "timeout_seconds": 30,
+        "max_retries": 3,
+        "api_tokens": ["test-token"]
+    },
+    "cache": {
+        "enabled": True,
+        "max_memory_mb": 128
+    },
+    "monitoring": {
+        "metrics_enabled": True,
+        "log_level": "DEBUG"
+    }
+}
+
+_PRODUCTION_CONFIG: Dict[str, Any] = {
+    "app_name": "d361-prod",
+    "environment": "production",
+    "debug": False,
+    "api": {
+        "timeout_seconds": 60,
+        "max_retries": 5,
+        "api_tokens": ["prod-token"]
+    },
+    "monitoring": {
+        "metrics_enabled": True,
+        "alerting_enabled": True,
+        "log_level": "INFO"
     }
+}
 
 
-@pytest.fixture
-def production_config_data() -> Dict[str, Any]:
-    """Production configuration data for testing."""
-    return {
-        "app_name": "d361-prod",
-        "environment": "production",
-        "debug": False,
-        "api": {
-            "timeout_seconds": 60,
-            "max_retries": 5,
-            "api_tokens": ["prod-token"]
-        },
-        "monitoring": {
-            "metrics_enabled": True,
-            "alerting_enabled": True,
-            "log_level": "INFO"
-        }
-    }
\ No newline at end of file
+@pytest.fixture(scope="session")
+def sample_config_data() -> Mapping[str, Any]:
+    """Sample configuration data for testing (read-only shared view)."""
+    return MappingProxyType(_SAMPLE_CONFIG)
+
+
+@pytest.fixture(scope="session")
+def production_config_data() -> Mapping[str, Any]:
+    """Production configuration data for testing (read-only shared view)."""
+    return MappingProxyType(_PRODUCTION_CONFIG)
\ No newline at end of file